@@ -0,0 +1,163 @@
+"""Caching layer for yfinance lookups.
+
+Market data requests dominate the toolkit's wall time, so price downloads and
+option chains go through an optional on-disk cache, and ``yf.Ticker`` objects
+are reused for the lifetime of the process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import yfinance as yf
+
+PRICE_TTL_SECONDS = 24 * 60 * 60  # roughly one trading day
+OPTION_CHAIN_TTL_SECONDS = 5 * 60
+_BATCH_KEY = "_batch"  # directory for multi-ticker downloads
+
+
+class FileCache:
+    """DataFrame cache stored under ``{root}/{ticker}/{endpoint}_{md5(params)}.json``.
+
+    Frames are written as split-orient JSON rather than pickled, so a cache
+    directory from an untrusted source cannot execute code when read. Values,
+    index and column labels round-trip; floats keep 15 significant digits and
+    datetime columns other than the index come back as ISO strings.
+    Entries older than the TTL passed to ``get`` are treated as misses. The
+    cache is best-effort: filesystem errors on read or write fall through to
+    a live fetch instead of failing the caller.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, ticker: str, endpoint: str, params: dict[str, Any]) -> Path:
+        payload = json.dumps(params, sort_keys=True, default=str).encode()
+        digest = hashlib.md5(payload, usedforsecurity=False).hexdigest()
+        return self.root / ticker / f"{endpoint}_{digest}.json"
+
+    def get(
+        self, ticker: str, endpoint: str, params: dict[str, Any], ttl: float
+    ) -> pd.DataFrame | None:
+        """Return the cached frame, or None if missing, expired or unreadable."""
+        path = self._path(ticker, endpoint, params)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            return None
+        if age > ttl:
+            return None
+        try:
+            payload = json.loads(path.read_text())
+            df = pd.read_json(io.StringIO(payload["frame"]), orient="split", dtype=False)
+            df.index = _relabel(df.index, payload["index_names"])
+            df.columns = _relabel(df.columns, payload["column_names"])
+        except Exception:
+            return None
+        return df
+
+    def put(
+        self, ticker: str, endpoint: str, params: dict[str, Any], df: pd.DataFrame
+    ) -> None:
+        """Store a frame, replacing any existing entry atomically.
+
+        Skips the write if the cache directory cannot be written.
+        """
+        path = self._path(ticker, endpoint, params)
+        tmp = path.with_suffix(".tmp")
+        payload = {
+            "index_names": list(df.index.names),
+            "column_names": list(df.columns.names),
+            "frame": df.to_json(orient="split", date_format="iso", double_precision=15),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload))
+            tmp.replace(path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+
+def _relabel(labels: pd.Index, names: list[str | None]) -> pd.Index:
+    """Restore level names, and MultiIndex levels, lost in the JSON round trip."""
+    if len(names) > 1:
+        return pd.MultiIndex.from_tuples([tuple(label) for label in labels], names=names)
+    return labels.rename(names[0])
+
+
+_FILE_CACHE: FileCache | None = None
+_TICKER_CACHE: dict[str, yf.Ticker] = {}
+_PRICE_CACHE: dict[str, float] = {}
+
+
+def enable_file_cache(root: str | Path | None) -> None:
+    """Enable the on-disk cache under ``root``, or disable it when None."""
+    global _FILE_CACHE
+    _FILE_CACHE = FileCache(root) if root is not None else None
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Return a process-wide ``yf.Ticker`` so its lazy lookups run once."""
+    tk = _TICKER_CACHE.get(symbol)
+    if tk is None:
+        tk = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
+    return tk
+
+
+def get_spot(symbol: str) -> float | None:
+    """Last traded price (or previous close), looked up once per process."""
+    price = _PRICE_CACHE.get(symbol)
+    if price is None:
+        info = get_ticker(symbol).fast_info
+        raw = info.get("lastPrice") or info.get("previousClose")
+        if raw is None:
+            return None
+        price = _PRICE_CACHE[symbol] = float(raw)
+    return price
+
+
+def _cached_download(tickers: str | list[str], **kwargs: Any) -> pd.DataFrame:
+    """``yf.download`` keyed on (tickers, kwargs), served from disk when fresh.
+
+    Single-ticker downloads are stored under that ticker; batched downloads
+    share one directory, with the symbol list folded into the params hash so
+    long lists never become a path component.
+    """
+    symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+    if len(symbols) == 1:
+        key, params = symbols[0], kwargs
+    else:
+        key, params = _BATCH_KEY, {**kwargs, "tickers": sorted(symbols)}
+    cache = _FILE_CACHE
+    if cache is not None:
+        cached = cache.get(key, "download", params, PRICE_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+    data = yf.download(tickers, **kwargs)
+    if cache is not None and not data.empty:
+        cache.put(key, "download", params, data)
+    return data
+
+
+def _cached_option_calls(ticker: str, expiration: str) -> pd.DataFrame:
+    """Call side of the option chain for one expiration, cached briefly on disk."""
+    cache = _FILE_CACHE
+    params = {"expiration": expiration}
+    if cache is not None:
+        cached = cache.get(ticker, "option_calls", params, OPTION_CHAIN_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
+    calls = get_ticker(ticker).option_chain(expiration).calls
+    if cache is not None and not calls.empty:
+        cache.put(ticker, "option_calls", params, calls)
+    return calls
@@ -0,0 +1,122 @@
+"""Rolling-window kernels for historical volatility.
+
+Numba and bottleneck are optional (``pip install vol-regime-toolkit[fast]``).
+``moving_std`` and ``moving_std_multi`` pick the fastest backend available
+and fall back to NumPy; the Numba kernels still run as plain Python without
+it, just slowly.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+    prange = range  # type: ignore[misc]
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """No-op stand-in for ``numba.njit``."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - exercised only without bottleneck
+    bn = None
+
+
+def moving_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample std (ddof=1) along axis 0 of a 1-D or (T, N) array.
+
+    Rows before the first full window, and windows containing a NaN, are NaN.
+    Uses bottleneck's C implementation when installed, then the Numba kernel,
+    then a NumPy sliding-window reduction.
+    """
+    if len(x) < window:
+        return np.full(x.shape, np.nan)
+    if bn is not None:
+        result: np.ndarray = bn.move_std(x, window, axis=0, ddof=1)
+        return result
+    if HAVE_NUMBA:
+        if x.ndim == 1:
+            return rolling_std(x.reshape(-1, 1), window)[:, 0]
+        return rolling_std(np.ascontiguousarray(x), window)
+    out = np.full(x.shape, np.nan)
+    out[window - 1:] = sliding_window_view(x, window, axis=0).std(axis=-1, ddof=1)
+    return out
+
+
+def moving_std_multi(x: np.ndarray, windows: Sequence[int]) -> list[np.ndarray]:
+    """``moving_std`` for several window lengths over the same array.
+
+    Backends are tried in the same order as ``moving_std``: bottleneck once
+    per window, then the Numba kernel, which updates every window in a single
+    traversal, then suffixes of one shared NumPy sliding-window view.
+    """
+    if len(x) == 0:
+        return [np.full(x.shape, np.nan) for _ in windows]
+    if bn is not None:
+        return [moving_std(x, window) for window in windows]
+    if HAVE_NUMBA:
+        x2d = np.ascontiguousarray(x.reshape(-1, 1) if x.ndim == 1 else x)
+        out = rolling_std_multi(x2d, np.asarray(windows, dtype=np.int64))
+        return [std.reshape(x.shape) for std in out]
+    w_max = max(windows)
+    padded = np.concatenate([np.full((w_max - 1, *x.shape[1:]), np.nan), x])
+    view = sliding_window_view(padded, w_max, axis=0)
+    return [view[..., w_max - window:].std(axis=-1, ddof=1) for window in windows]
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample std (ddof=1) down each column of a (T, N) array."""
+    result: np.ndarray = rolling_std_multi(x, np.array([window], dtype=np.int64))[0]
+    return result
+
+
+@njit(parallel=True, cache=True)
+def rolling_std_multi(x: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """Rolling sample std (ddof=1) of a (T, N) array for each window length.
+
+    Uses Welford's online update with a sliding window, advancing all window
+    lengths in lockstep. Returns shape (len(windows), T, N). Like pandas'
+    ``rolling(window).std()``, any NaN inside a window makes that row NaN.
+    """
+    n_rows, n_cols = x.shape
+    n_win = len(windows)
+    out = np.full((n_win, n_rows, n_cols), np.nan)
+    for j in prange(n_cols):
+        mean = np.zeros(n_win)
+        m2 = np.zeros(n_win)
+        count = np.zeros(n_win, dtype=np.int64)  # NaN-free run, capped at window
+        for t in range(n_rows):
+            v = x[t, j]
+            if np.isnan(v):
+                mean[:] = 0.0
+                m2[:] = 0.0
+                count[:] = 0
+                continue
+            for w in range(n_win):
+                window = windows[w]
+                if count[w] < window:
+                    count[w] += 1
+                    delta = v - mean[w]
+                    mean[w] += delta / count[w]
+                    m2[w] += delta * (v - mean[w])
+                else:
+                    old = x[t - window, j]
+                    new_mean = mean[w] + (v - old) / window
+                    m2[w] += (v - old) * (v - new_mean + old - mean[w])
+                    mean[w] = new_mean
+                if count[w] == window:
+                    out[w, t, j] = math.sqrt(max(m2[w], 0.0) / (window - 1))
+    return out
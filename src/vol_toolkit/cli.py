@@ -4,13 +4,23 @@ from __future__ import annotations
 
 import click
 import numpy as np
-import yfinance as yf
+import pandas as pd
+
+from vol_toolkit._cache import _cached_download, enable_file_cache
 
 
 @click.group()
 @click.version_option(package_name="vol-regime-toolkit")
-def main() -> None:
+@click.option(
+    "--cache-dir",
+    default=".cache",
+    show_default=True,
+    help="Directory for cached market data.",
+)
+@click.option("--no-cache", is_flag=True, help="Always fetch fresh market data.")
+def main(cache_dir: str, no_cache: bool) -> None:
     """Vol Regime Trading Toolkit - volatility analysis for options selling."""
+    enable_file_cache(None if no_cache else cache_dir)
 
 
 @main.command()
@@ -88,13 +98,14 @@ def forecast(ticker: str, horizon: int) -> None:
 
     click.echo(f"GARCH(1,1) forecast for {ticker}...\n")
 
-    data = yf.download(ticker, period="2y", progress=False)
+    data = _cached_download(ticker, period="2y", progress=False)
     if data.empty:
         click.echo(f"No data available for {ticker}.")
         return
 
-    close = data["Close"].squeeze().dropna()
-    returns = np.log(close / close.shift(1)).dropna()
+    close = data["Close"].to_numpy(dtype=np.float64).ravel()
+    close = close[~np.isnan(close)]
+    returns = pd.Series(np.diff(np.log(close)))  # arch expects a Series
 
     result = forecast_garch(returns, horizon=horizon)
 
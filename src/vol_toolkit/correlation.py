@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from vol_toolkit._cache import _cached_download
 
 
 def rolling_correlation(
@@ -23,7 +26,7 @@ def rolling_correlation(
     if len(tickers) < 2:
         raise ValueError("Need at least 2 tickers for correlation")
 
-    data = yf.download(tickers, period=period, progress=False)
+    data = _cached_download(tickers, period=period, progress=False)
     if data.empty:
         raise ValueError("No data available for given tickers")
 
@@ -35,9 +38,12 @@ def rolling_correlation(
     if len(close) < window:
         raise ValueError(f"Need at least {window} data points, got {len(close)}")
 
-    returns = np.log(close / close.shift(1)).dropna()
-    recent = returns.iloc[-window:]
-    return recent.corr()
+    log_ret = np.diff(np.log(close.to_numpy(dtype=np.float64)), axis=0)
+    # float32 is ample for correlations and halves the bytes moved
+    corr = np.corrcoef(log_ret[-window:], rowvar=False, dtype=np.float32)
+    return pd.DataFrame(
+        corr.astype(np.float64), index=close.columns, columns=close.columns
+    )
 
 
 def detect_correlation_regime(
@@ -58,7 +64,7 @@ def detect_correlation_regime(
     if len(tickers) < 2:
         raise ValueError("Need at least 2 tickers")
 
-    data = yf.download(tickers, period="2y", progress=False)
+    data = _cached_download(tickers, period="2y", progress=False)
     if data.empty:
         raise ValueError("No data available for given tickers")
 
@@ -67,39 +73,32 @@ def detect_correlation_regime(
         raise ValueError("Need at least 2 tickers with data")
 
     close = close.dropna()
-    returns = np.log(close / close.shift(1)).dropna()
+    returns = np.diff(np.log(close.to_numpy(dtype=np.float64)), axis=0).astype(np.float32)
 
     if len(returns) < 120:
         raise ValueError("Need at least 120 data points for regime detection")
 
     # Current: 30-day rolling correlation
-    current_corr = returns.iloc[-30:].corr()
+    curr_values = np.corrcoef(returns[-30:], rowvar=False, dtype=np.float32)
     # Average: full-period correlation
-    avg_corr = returns.corr()
+    avg_values = np.corrcoef(returns, rowvar=False, dtype=np.float32)
+
+    # Positions follow the downloaded column order, not the input order
+    position = {t: k for k, t in enumerate(close.columns)}
+    present = [t for t in dict.fromkeys(tickers) if t in position]
 
     results = []
-    seen = set()
-    for i, t1 in enumerate(tickers):
-        for j, t2 in enumerate(tickers):
-            if i >= j:
-                continue
-            pair_key = (t1, t2)
-            if pair_key in seen:
-                continue
-            seen.add(pair_key)
-
-            if t1 not in current_corr.columns or t2 not in current_corr.columns:
-                continue
-
-            curr = float(current_corr.loc[t1, t2])
-            avg = float(avg_corr.loc[t1, t2])
-            regime = "HIGH" if curr >= threshold else "NORMAL"
-
-            results.append({
-                "pair": f"{t1}/{t2}",
-                "current_corr": round(curr, 4),
-                "avg_corr": round(avg, 4),
-                "regime": regime,
-            })
+    for t1, t2 in itertools.combinations(present, 2):
+        i, j = position[t1], position[t2]
+        curr = float(curr_values[i, j])
+        avg = float(avg_values[i, j])
+        regime = "HIGH" if curr >= threshold else "NORMAL"
+
+        results.append({
+            "pair": f"{t1}/{t2}",
+            "current_corr": round(curr, 4),
+            "avg_corr": round(avg, 4),
+            "regime": regime,
+        })
 
     return results
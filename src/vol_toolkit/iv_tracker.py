@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from vol_toolkit._cache import _cached_download, _cached_option_calls, get_spot, get_ticker
+from vol_toolkit._kernels import moving_std
 
 
 def _hv_series(prices: pd.Series, window: int = 20) -> pd.Series:
     """Compute rolling historical volatility series."""
-    log_ret = np.log(prices / prices.shift(1))
-    return log_ret.rolling(window).std() * math.sqrt(252)
+    # Returns are differenced in float64, then windowed in float32; the
+    # result is float64 whichever backend ran
+    log_ret = np.diff(np.log(prices.to_numpy(dtype=np.float64))).astype(np.float32)
+    std = moving_std(log_ret, window).astype(np.float64)
+    return pd.Series(std * math.sqrt(252), index=prices.index[1:])
 
 
 def get_iv_percentile(ticker: str, lookback_days: int = 252) -> dict:
@@ -33,28 +40,28 @@ def get_iv_percentile(ticker: str, lookback_days: int = 252) -> dict:
     end = datetime.now()
     start = end - timedelta(days=int(lookback_days * 1.6))  # calendar days buffer
 
-    data = yf.download(ticker, start=start.strftime("%Y-%m-%d"), progress=False)
+    data = _cached_download(ticker, start=start.strftime("%Y-%m-%d"), progress=False)
     if data.empty:
         raise ValueError(f"No price data available for {ticker}")
 
     close = data["Close"].squeeze().dropna()
 
-    # Try to get ATM IV from nearest expiry options chain
-    current_iv = _try_get_atm_iv(ticker)
-
     # Build HV series as proxy for historical IV distribution
-    hv = _hv_series(close, window=20).dropna()
-    if len(hv) < 20:
+    hv_values = _hv_series(close, window=20).dropna().to_numpy()
+    if len(hv_values) < 20:
         raise ValueError(f"Insufficient data for {ticker}")
 
+    # Try to get ATM IV from nearest expiry options chain
+    current_iv = _try_get_atm_iv(ticker)
     if current_iv is None:
         # Fall back to current HV as proxy
-        current_iv = float(hv.iloc[-1])
+        current_iv = float(hv_values[-1])
 
-    hv_values = hv.values
-    iv_percentile = float(np.sum(hv_values <= current_iv) / len(hv_values) * 100)
-    high_iv = float(np.max(hv_values))
-    low_iv = float(np.min(hv_values))
+    hv_sorted = np.sort(hv_values)
+    rank = int(np.searchsorted(hv_sorted, current_iv, side="right"))
+    iv_percentile = float(rank / len(hv_values) * 100)
+    high_iv = float(hv_sorted[-1])
+    low_iv = float(hv_sorted[0])
 
     iv_range = high_iv - low_iv
     iv_rank = float((current_iv - low_iv) / iv_range * 100) if iv_range > 0 else 50.0
@@ -77,35 +84,48 @@ def get_iv_percentile(ticker: str, lookback_days: int = 252) -> dict:
     }
 
 
+@lru_cache(maxsize=256)
+def _get_expirations(ticker: str) -> tuple[str, ...]:
+    """Option expiration dates for a ticker, fetched once per process."""
+    return tuple(get_ticker(ticker).options)
+
+
+def _atm_call_iv(calls: pd.DataFrame, current_price: float) -> float | None:
+    """Implied vol of the call struck closest to ``current_price``.
+
+    Quotes with missing or implausible IV are skipped, so an illiquid ATM
+    strike falls through to the nearest usable one. Returns None if no
+    quote is usable.
+    """
+    iv_arr = calls["impliedVolatility"].to_numpy(dtype=np.float64)
+    strikes = calls["strike"].to_numpy(dtype=np.float64)
+    # Sanity check: IV should be between 0 and 10 (1000%)
+    usable = np.isfinite(iv_arr) & (iv_arr > 0) & (iv_arr < 10)
+    if not usable.any():
+        return None
+    idx = int(np.argmin(np.abs(strikes[usable] - current_price)))
+    return float(iv_arr[usable][idx])
+
+
 def _try_get_atm_iv(ticker: str) -> float | None:
     """Try to extract ATM implied volatility from yfinance options chain."""
     try:
-        tk = yf.Ticker(ticker)
-        expirations = tk.options
+        expirations = _get_expirations(ticker)
         if not expirations:
             return None
 
         # Use nearest expiration
-        chain = tk.option_chain(expirations[0])
-        calls = chain.calls
+        calls = _cached_option_calls(ticker, expirations[0])
 
         if calls.empty or "impliedVolatility" not in calls.columns:
             return None
 
         # Find ATM: closest strike to current price
-        current_price = tk.fast_info.get("lastPrice") or tk.fast_info.get("previousClose")
+        current_price = get_spot(ticker)
         if current_price is None:
             return None
 
-        calls = calls.copy()
-        calls["distance"] = abs(calls["strike"] - current_price)
-        atm_row = calls.loc[calls["distance"].idxmin()]
-        iv = float(atm_row["impliedVolatility"])
-
-        # Sanity check: IV should be between 0 and 10 (1000%)
-        if 0 < iv < 10:
-            return iv
-        return None
+        return _atm_call_iv(calls, current_price)
     except Exception:
         return None
 
@@ -119,34 +139,32 @@ def get_iv_term_structure(ticker: str) -> list[dict]:
     Returns:
         List of dicts with expiration, days_to_expiry, atm_iv for each expiry.
     """
-    tk = yf.Ticker(ticker)
-    expirations = tk.options
+    expirations = _get_expirations(ticker)
     if not expirations:
         return []
 
-    current_price = tk.fast_info.get("lastPrice") or tk.fast_info.get("previousClose")
+    current_price = get_spot(ticker)
     if current_price is None:
         return []
 
+    # Chains are independent requests, so fetch them concurrently
+    selected = expirations[:8]  # Limit to first 8 expirations
+    with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+        chains = list(pool.map(partial(_try_get_option_calls, ticker), selected))
+
     today = datetime.now().date()
     results = []
 
-    for exp_str in expirations[:8]:  # Limit to first 8 expirations
+    for exp_str, calls in zip(selected, chains):
+        if calls is None or calls.empty or "impliedVolatility" not in calls.columns:
+            continue
         try:
-            chain = tk.option_chain(exp_str)
-            calls = chain.calls
-            if calls.empty or "impliedVolatility" not in calls.columns:
-                continue
-
-            calls = calls.copy()
-            calls["distance"] = abs(calls["strike"] - current_price)
-            atm_row = calls.loc[calls["distance"].idxmin()]
-            iv = float(atm_row["impliedVolatility"])
+            iv = _atm_call_iv(calls, current_price)
 
             exp_date = datetime.strptime(exp_str, "%Y-%m-%d").date()
             dte = (exp_date - today).days
 
-            if 0 < iv < 10 and dte > 0:
+            if iv is not None and dte > 0:
                 results.append({
                     "expiration": exp_str,
                     "days_to_expiry": dte,
@@ -156,3 +174,11 @@ def get_iv_term_structure(ticker: str) -> list[dict]:
             continue
 
     return results
+
+
+def _try_get_option_calls(ticker: str, expiration: str) -> pd.DataFrame | None:
+    """Fetch the call chain for one expiration, or None on failure."""
+    try:
+        return _cached_option_calls(ticker, expiration)
+    except Exception:
+        return None
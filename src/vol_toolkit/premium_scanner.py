@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
-from vol_toolkit.iv_tracker import _hv_series, _try_get_atm_iv
+from vol_toolkit._cache import _cached_download
+from vol_toolkit._kernels import moving_std_multi
+from vol_toolkit.iv_tracker import _try_get_atm_iv
 
 
 def scan_vol_premium(tickers: list[str], lookback: int = 252) -> pd.DataFrame:
@@ -29,17 +31,32 @@ def scan_vol_premium(tickers: list[str], lookback: int = 252) -> pd.DataFrame:
         Columns: ticker, current_iv, realized_vol_20d, premium, premium_pct,
                  iv_percentile, signal.
     """
+    # yf.download upper-cases symbols in its (ticker, field) columns
+    tickers = [t.upper() for t in tickers]
     end = datetime.now()
     start = end - timedelta(days=int(lookback * 1.6))
 
+    # One batched request for all tickers instead of one round-trip each
+    data = _cached_download(
+        tickers,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+
     rows = []
-    for ticker in tickers:
-        try:
-            row = _scan_single(ticker, start, end, lookback)
+    if not data.empty:
+        symbols, close_mat = _close_matrix(data, tickers)
+        # Every ticker's 20/10/30-day HV from one pass over the returns
+        # Differenced in float64, then windowed in float32 to halve bandwidth
+        log_ret = np.diff(np.log(close_mat), axis=0).astype(np.float32)
+        hv, hv_fast, hv_slow = _hv_matrices(log_ret, (20, 10, 30))
+        for j, ticker in enumerate(symbols):
+            row = _scan_single(ticker, hv[:, j], hv_fast[:, j], hv_slow[:, j])
             if row is not None:
                 rows.append(row)
-        except Exception:
-            continue
 
     if not rows:
         return pd.DataFrame(
@@ -59,47 +76,89 @@ def scan_vol_premium(tickers: list[str], lookback: int = 252) -> pd.DataFrame:
     return df
 
 
-def _scan_single(
-    ticker: str, start: datetime, end: datetime, lookback: int
-) -> dict | None:
-    """Scan a single ticker for vol premium data."""
-    data = yf.download(
-        ticker,
-        start=start.strftime("%Y-%m-%d"),
-        end=end.strftime("%Y-%m-%d"),
-        progress=False,
-    )
-    if data.empty or len(data) < 30:
-        return None
+def _ticker_close(data: pd.DataFrame, ticker: str) -> np.ndarray | None:
+    """Extract one ticker's non-NaN closes from a batched download.
 
-    close = data["Close"].squeeze().dropna()
+    Multi-ticker downloads grouped by ticker have (ticker, field) columns;
+    a single-ticker download comes back with flat field columns.
+    """
+    if isinstance(data.columns, pd.MultiIndex):
+        if (ticker, "Close") not in data.columns:
+            return None
+        close = data[(ticker, "Close")].to_numpy(dtype=np.float64)
+    else:
+        if "Close" not in data.columns:
+            return None
+        close = data["Close"].to_numpy(dtype=np.float64).ravel()
+    valid: np.ndarray = close[~np.isnan(close)]
+    return valid
 
-    # Current IV: try options chain, fall back to HV
-    current_iv = _try_get_atm_iv(ticker)
 
-    hv = _hv_series(close, window=20).dropna()
+def _close_matrix(data: pd.DataFrame, tickers: list[str]) -> tuple[list[str], np.ndarray]:
+    """Stack each ticker's closes into a (T, N) matrix.
+
+    Series are right-aligned so the latest closes share the last row; shorter
+    histories are NaN-padded at the top. Tickers with fewer than 30 closes
+    are left out.
+    """
+    columns: dict[str, np.ndarray] = {}
+    for ticker in tickers:
+        close = _ticker_close(data, ticker)
+        if close is not None and len(close) >= 30:
+            columns[ticker] = close
+
+    n_rows = max((len(c) for c in columns.values()), default=0)
+    close_mat = np.full((n_rows, len(columns)), np.nan)
+    for j, close_arr in enumerate(columns.values()):
+        close_mat[n_rows - len(close_arr):, j] = close_arr
+    return list(columns), close_mat
+
+
+def _hv_matrices(log_ret: np.ndarray, windows: tuple[int, ...]) -> list[np.ndarray]:
+    """Rolling annualized HV down each column of a (T, N) log-return matrix.
+
+    Returns one float64 matrix per window; rows before the first full window
+    are NaN, matching ``_hv_series``.
+    """
+    return [
+        std.astype(np.float64) * math.sqrt(252)
+        for std in moving_std_multi(log_ret, windows)
+    ]
+
+
+def _scan_single(
+    ticker: str, hv: np.ndarray, hv_fast: np.ndarray, hv_slow: np.ndarray
+) -> dict | None:
+    """Scan a single ticker given its 20/10/30-day HV columns."""
+    hv = hv[~np.isnan(hv)]
     if len(hv) < 20:
         return None
 
+    # Current IV: try options chain, fall back to HV
+    current_iv = _try_get_atm_iv(ticker)
     if current_iv is None:
-        current_iv = float(hv.iloc[-1])
+        current_iv = float(hv[-1])
 
-    rv_20d = float(hv.iloc[-1])
+    rv_20d = float(hv[-1])
     premium = current_iv - rv_20d
 
     # Premium percentile: how does current premium compare historically?
     # Use trailing HV at different points as proxy for historical IV
-    hv_fast = _hv_series(close, window=10).dropna()
-    hv_slow = _hv_series(close, window=30).dropna()
+    hv_fast = hv_fast[~np.isnan(hv_fast)]
+    hv_slow = hv_slow[~np.isnan(hv_slow)]
     min_len = min(len(hv_fast), len(hv_slow))
     if min_len < 20:
         premium_pct = 50.0
     else:
-        hist_premium = hv_fast.iloc[-min_len:].values - hv_slow.iloc[-min_len:].values
-        premium_pct = float(np.sum(hist_premium <= premium) / len(hist_premium) * 100)
+        hist_premium = hv_fast[-min_len:] - hv_slow[-min_len:]
+        hist_premium.sort()
+        rank = np.searchsorted(hist_premium, premium, side="right")
+        premium_pct = float(rank / len(hist_premium) * 100)
 
     # IV percentile
-    iv_percentile = float(np.sum(hv.values <= current_iv) / len(hv) * 100)
+    hv_sorted = np.sort(hv)
+    rank = np.searchsorted(hv_sorted, current_iv, side="right")
+    iv_percentile = float(rank / len(hv_sorted) * 100)
 
     if iv_percentile >= 75 and premium > 0:
         signal = "SELL"
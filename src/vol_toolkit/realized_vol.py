@@ -23,13 +23,14 @@ def calculate_realized_vol(
     Returns:
         Realized volatility as a decimal (e.g. 0.25 = 25%).
     """
-    log_returns = np.log(prices / prices.shift(1)).dropna()
+    log_returns = np.diff(np.log(np.asarray(prices, dtype=np.float64)))
+    log_returns = log_returns[~np.isnan(log_returns)]
     if len(log_returns) < window:
         raise ValueError(f"Need at least {window} returns, got {len(log_returns)}")
-    vol = log_returns.iloc[-window:].std()
+    vol = float(np.std(log_returns[-window:], ddof=1))
     if annualize:
         vol *= math.sqrt(TRADING_DAYS_PER_YEAR)
-    return float(vol)
+    return vol
 
 
 def calculate_parkinson_vol(
@@ -47,12 +48,19 @@ def calculate_parkinson_vol(
     Returns:
         Annualized Parkinson volatility as a decimal.
     """
-    if len(high) < window or len(low) < window:
+    high_arr = np.asarray(high, dtype=np.float64)
+    low_arr = np.asarray(low, dtype=np.float64)
+    if len(high_arr) < window or len(low_arr) < window:
         raise ValueError(f"Need at least {window} data points")
-    log_hl = np.log(high / low)
-    recent = log_hl.iloc[-window:]
+    # log(H/L) in place, then the sum of squares as a dot product over the
+    # finite entries; missing bars are skipped, as pandas' mean would
+    log_hl = high_arr[-window:] / low_arr[-window:]
+    np.log(log_hl, out=log_hl)
+    log_hl = log_hl[np.isfinite(log_hl)]
+    if len(log_hl) == 0:
+        return math.nan
     factor = 1.0 / (4.0 * math.log(2))
-    variance = factor * (recent**2).mean()
+    variance = factor * float(np.dot(log_hl, log_hl)) / len(log_hl)
     return float(math.sqrt(variance * TRADING_DAYS_PER_YEAR))
 
 
@@ -74,7 +82,9 @@ def forecast_garch(returns: pd.Series, horizon: int = 5) -> dict:
         raise ValueError("Need at least 100 returns for GARCH estimation")
 
     model = arch_model(scaled, vol="GARCH", p=1, q=1, mean="Zero", rescale=False)
-    result = model.fit(disp="off", show_warning=False)
+    # GARCH(1,1) converges in ~10 SLSQP iterations; cap runaway fits well
+    # below scipy's default of 100
+    result = model.fit(disp="off", show_warning=False, options={"maxiter": 50})
 
     omega = result.params["omega"]
     alpha = result.params["alpha[1]"]
@@ -82,8 +92,7 @@ def forecast_garch(returns: pd.Series, horizon: int = 5) -> dict:
     persistence = alpha + beta
 
     # Current conditional variance (last fitted value, in pct^2)
-    cond_vol = pd.Series(result.conditional_volatility)
-    current_var = float(cond_vol.iloc[-1] ** 2)
+    current_var = float(np.asarray(result.conditional_volatility)[-1] ** 2)
 
     # Unconditional (long-run) variance
     if persistence < 1.0:
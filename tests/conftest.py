@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pandas as pd
+import pytest
+
+from tests.synthetic import gbm_path
+
+
+@pytest.fixture(scope="session")
+def gbm_prices() -> Callable[..., pd.Series]:
+    """Factory for cached synthetic GBM close series."""
+
+    def make(n: int = 300, mu: float = 0.0, sigma: float = 0.20, seed: int = 42) -> pd.Series:
+        return pd.Series(gbm_path(n, mu, sigma, seed), name="Close", copy=False)
+
+    return make
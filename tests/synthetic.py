@@ -0,0 +1,54 @@
+"""Synthetic price generators shared by the test modules."""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+_DT = 1 / 252
+_SQRT_DT = math.sqrt(_DT)
+
+
+@lru_cache(maxsize=None)
+def _normals(n: int, seed: int) -> np.ndarray:
+    """Standard normal draws shared by every path built from ``seed``."""
+    z = np.random.default_rng(seed).standard_normal(n)
+    z.flags.writeable = False
+    return z
+
+
+@lru_cache(maxsize=None)
+def gbm_path(n: int, mu: float, sigma: float, seed: int) -> np.ndarray:
+    """Synthetic GBM prices with known volatility, generated once per parameter set.
+
+    Paths with the same seed rescale the same normal draws, so a sigma sweep
+    compares different volatilities over identical noise. The returned array
+    is read-only because callers share it.
+    """
+    # Build log returns, cumulate and exponentiate in place on one buffer
+    prices = _normals(n, seed) * (sigma * _SQRT_DT)
+    prices += (mu - 0.5 * sigma**2) * _DT
+    np.cumsum(prices, out=prices)
+    np.exp(prices, out=prices)
+    prices *= 100
+    prices.flags.writeable = False
+    return prices
+
+
+@lru_cache(maxsize=None)
+def high_low_path(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Synthetic daily highs and lows around a random-walk close.
+
+    Draws come from the same per-seed cache as ``gbm_path``: rows of the
+    (3, n) block are close steps, high offsets and low offsets.
+    """
+    draws = _normals(3 * n, seed).reshape(3, n)
+    close = 100 + np.cumsum(draws[0] * 0.5)
+    offsets = np.abs(draws[1:])
+    high = close + offsets[0]
+    low = close - offsets[1]
+    high.flags.writeable = False
+    low.flags.writeable = False
+    return high, low
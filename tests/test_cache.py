@@ -0,0 +1,137 @@
+"""Tests for the yfinance caching layer (all mocked, no live API calls)."""
+
+from __future__ import annotations
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from vol_toolkit import _cache
+from vol_toolkit._cache import (
+    FileCache,
+    _cached_download,
+    enable_file_cache,
+    get_spot,
+    get_ticker,
+)
+
+
+def _frame() -> pd.DataFrame:
+    dates = pd.bdate_range(start="2025-01-01", periods=5)
+    return pd.DataFrame({"Close": [100.0, 101.0, 102.0, 101.5, 103.0]}, index=dates)
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    enable_file_cache(tmp_path)
+    yield tmp_path
+    enable_file_cache(None)
+
+
+class TestFileCache:
+    def test_roundtrip(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.put("AAPL", "download", {"period": "1y"}, _frame())
+
+        result = cache.get("AAPL", "download", {"period": "1y"}, ttl=60)
+
+        assert result is not None
+        pd.testing.assert_frame_equal(result, _frame(), check_freq=False)
+        assert cache.get("AAPL", "download", {"period": "2y"}, ttl=60) is None
+
+    def test_multiindex_roundtrip(self, tmp_path):
+        cache = FileCache(tmp_path)
+        frame = pd.concat({"SPY": _frame(), "QQQ": _frame() * 2}, axis=1, names=["Ticker"])
+        frame.index.name = "Date"
+
+        cache.put("_batch", "download", {}, frame)
+        result = cache.get("_batch", "download", {}, ttl=60)
+
+        assert result is not None
+        pd.testing.assert_frame_equal(result, frame, check_freq=False)
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.put("AAPL", "download", {}, _frame())
+        path = next((tmp_path / "AAPL").glob("download_*.json"))
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+
+        assert cache.get("AAPL", "download", {}, ttl=60) is None
+
+    def test_unwritable_root_is_skipped(self, tmp_path):
+        root = tmp_path / "not_a_dir"
+        root.write_text("")
+        cache = FileCache(root)
+
+        cache.put("AAPL", "download", {}, _frame())
+
+        assert cache.get("AAPL", "download", {}, ttl=60) is None
+
+
+class TestCachedDownload:
+    @patch("vol_toolkit._cache.yf.download")
+    def test_warm_cache_skips_download(self, mock_download, file_cache):
+        mock_download.return_value = _frame()
+
+        first = _cached_download("AAPL", period="1y", progress=False)
+        second = _cached_download("AAPL", period="1y", progress=False)
+
+        assert mock_download.call_count == 1
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    @patch("vol_toolkit._cache.yf.download")
+    def test_long_ticker_list_is_cached(self, mock_download, file_cache):
+        mock_download.return_value = _frame()
+        tickers = [f"T{i:03d}" for i in range(60)]
+
+        _cached_download(tickers, period="1y")
+        _cached_download(list(reversed(tickers)), period="1y")
+        _cached_download(tickers[:-1], period="1y")
+
+        assert mock_download.call_count == 2
+
+    @patch("vol_toolkit._cache.yf.download")
+    def test_empty_result_not_cached(self, mock_download, file_cache):
+        mock_download.return_value = pd.DataFrame()
+
+        _cached_download("FAKE", period="1y")
+        _cached_download("FAKE", period="1y")
+
+        assert mock_download.call_count == 2
+
+    @patch("vol_toolkit._cache.yf.download")
+    def test_disabled_cache_always_downloads(self, mock_download):
+        mock_download.return_value = _frame()
+
+        _cached_download("AAPL", period="1y")
+        _cached_download("AAPL", period="1y")
+
+        assert mock_download.call_count == 2
+
+
+class TestGetTicker:
+    @patch("vol_toolkit._cache.yf.Ticker")
+    def test_ticker_reused(self, mock_ticker):
+        _cache._TICKER_CACHE.clear()
+
+        assert get_ticker("AAPL") is get_ticker("AAPL")
+        mock_ticker.assert_called_once_with("AAPL")
+        _cache._TICKER_CACHE.clear()
+
+
+class TestGetSpot:
+    @patch("vol_toolkit._cache.get_ticker")
+    def test_falls_back_to_previous_close_and_memoizes(self, mock_ticker):
+        _cache._PRICE_CACHE.clear()
+        mock_ticker.return_value = MagicMock(
+            fast_info={"lastPrice": None, "previousClose": 99.5}
+        )
+
+        assert get_spot("AAPL") == 99.5
+        assert get_spot("AAPL") == 99.5
+        mock_ticker.assert_called_once_with("AAPL")
+        _cache._PRICE_CACHE.clear()
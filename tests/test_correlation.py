@@ -41,7 +41,7 @@ def _make_correlated_prices(
 
 
 class TestRollingCorrelation:
-    @patch("vol_toolkit.correlation.yf.download")
+    @patch("vol_toolkit.correlation._cached_download")
     def test_high_correlation(self, mock_download):
         mock_download.return_value = _make_correlated_prices(
             ["TQQQ", "SOXL"], correlation=0.95
@@ -50,8 +50,9 @@ class TestRollingCorrelation:
 
         assert corr.shape == (2, 2)
         assert corr.loc["TQQQ", "SOXL"] > 0.80  # Should detect high correlation
+        assert (corr.dtypes == np.float64).all()
 
-    @patch("vol_toolkit.correlation.yf.download")
+    @patch("vol_toolkit.correlation._cached_download")
     def test_low_correlation(self, mock_download):
         mock_download.return_value = _make_correlated_prices(
             ["A", "B"], correlation=0.10, seed=99
@@ -66,7 +67,7 @@ class TestRollingCorrelation:
 
 
 class TestDetectCorrelationRegime:
-    @patch("vol_toolkit.correlation.yf.download")
+    @patch("vol_toolkit.correlation._cached_download")
     def test_high_regime_detected(self, mock_download):
         mock_download.return_value = _make_correlated_prices(
             ["TQQQ", "SOXL"], n=300, correlation=0.95
@@ -77,7 +78,7 @@ class TestDetectCorrelationRegime:
         assert results[0]["regime"] == "HIGH"
         assert results[0]["pair"] == "TQQQ/SOXL"
 
-    @patch("vol_toolkit.correlation.yf.download")
+    @patch("vol_toolkit.correlation._cached_download")
     def test_normal_regime(self, mock_download):
         mock_download.return_value = _make_correlated_prices(
             ["A", "B"], n=300, correlation=0.30, seed=123
@@ -87,7 +88,7 @@ class TestDetectCorrelationRegime:
         assert len(results) == 1
         assert results[0]["regime"] == "NORMAL"
 
-    @patch("vol_toolkit.correlation.yf.download")
+    @patch("vol_toolkit.correlation._cached_download")
     def test_multiple_pairs(self, mock_download):
         mock_download.return_value = _make_correlated_prices(
             ["A", "B", "C"], n=300, correlation=0.70
@@ -100,3 +101,17 @@ class TestDetectCorrelationRegime:
             assert "pair" in r
             assert "current_corr" in r
             assert "regime" in r
+
+    @patch("vol_toolkit.correlation._cached_download")
+    def test_pairs_follow_input_order(self, mock_download):
+        # yfinance returns columns sorted, which need not match the request
+        mock_download.return_value = _make_correlated_prices(
+            ["A", "B", "C"], n=300, correlation=0.50
+        )
+        forward = detect_correlation_regime(["A", "B", "C"])
+        reverse = detect_correlation_regime(["C", "B", "A", "MISSING"])
+
+        assert [r["pair"] for r in reverse] == ["C/B", "C/A", "B/A"]
+        by_pair = {r["pair"]: r["current_corr"] for r in forward}
+        assert reverse[0]["current_corr"] == by_pair["B/C"]
+        assert reverse[1]["current_corr"] == by_pair["A/C"]
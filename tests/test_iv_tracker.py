@@ -2,29 +2,41 @@
 
 from __future__ import annotations
 
-import math
-from unittest.mock import patch
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from vol_toolkit.iv_tracker import get_iv_percentile
+from tests.synthetic import gbm_path
+from vol_toolkit.iv_tracker import (
+    _atm_call_iv,
+    _get_expirations,
+    _hv_series,
+    get_iv_percentile,
+    get_iv_term_structure,
+)
 
 
 def _make_mock_prices(n: int = 300, sigma: float = 0.20, seed: int = 42) -> pd.DataFrame:
     """Create mock yfinance download output."""
-    rng = np.random.default_rng(seed)
-    dt = 1 / 252
-    log_ret = (0.0 - 0.5 * sigma**2) * dt + sigma * math.sqrt(dt) * rng.standard_normal(n)
-    close = 100 * np.exp(np.cumsum(log_ret))
+    close = gbm_path(n, 0.0, sigma, seed)
     dates = pd.bdate_range(start="2025-01-01", periods=len(close))
     return pd.DataFrame({"Close": close}, index=dates)
 
 
+class TestHvSeries:
+    def test_returns_float64(self):
+        hv = _hv_series(_make_mock_prices()["Close"])
+
+        assert hv.dtype == np.float64
+        assert hv.index.equals(_make_mock_prices().index[1:])
+
+
 class TestGetIvPercentile:
     @patch("vol_toolkit.iv_tracker._try_get_atm_iv", return_value=None)
-    @patch("vol_toolkit.iv_tracker.yf.download")
+    @patch("vol_toolkit.iv_tracker._cached_download")
     def test_basic_percentile(self, mock_download, mock_atm):
         mock_download.return_value = _make_mock_prices(300, sigma=0.20)
 
@@ -38,7 +50,7 @@ class TestGetIvPercentile:
         assert result["signal"] in ("SELL", "WAIT", "NEUTRAL")
 
     @patch("vol_toolkit.iv_tracker._try_get_atm_iv", return_value=0.80)
-    @patch("vol_toolkit.iv_tracker.yf.download")
+    @patch("vol_toolkit.iv_tracker._cached_download")
     def test_high_iv_gives_sell(self, mock_download, mock_atm):
         # Use low-vol prices so that an IV of 0.80 is very high percentile
         mock_download.return_value = _make_mock_prices(300, sigma=0.10)
@@ -49,7 +61,7 @@ class TestGetIvPercentile:
         assert result["iv_percentile"] >= 75
 
     @patch("vol_toolkit.iv_tracker._try_get_atm_iv", return_value=0.02)
-    @patch("vol_toolkit.iv_tracker.yf.download")
+    @patch("vol_toolkit.iv_tracker._cached_download")
     def test_low_iv_gives_wait(self, mock_download, mock_atm):
         mock_download.return_value = _make_mock_prices(300, sigma=0.30)
 
@@ -59,9 +71,71 @@ class TestGetIvPercentile:
         assert result["iv_percentile"] <= 25
 
     @patch("vol_toolkit.iv_tracker._try_get_atm_iv", return_value=None)
-    @patch("vol_toolkit.iv_tracker.yf.download")
+    @patch("vol_toolkit.iv_tracker._cached_download")
     def test_empty_data_raises(self, mock_download, mock_atm):
         mock_download.return_value = pd.DataFrame()
 
         with pytest.raises(ValueError, match="No price data"):
             get_iv_percentile("FAKE")
+
+
+class TestAtmCallIv:
+    def test_closest_strike(self):
+        calls = pd.DataFrame({
+            "strike": [90.0, 95.0, 100.0, 105.0],
+            "impliedVolatility": [0.40, 0.35, 0.30, 0.28],
+        })
+
+        assert _atm_call_iv(calls, 101.0) == 0.30
+        assert _atm_call_iv(calls, 93.0) == 0.35
+
+    def test_skips_missing_iv(self):
+        calls = pd.DataFrame({
+            "strike": [95.0, 100.0, 105.0],
+            "impliedVolatility": [0.35, np.nan, 0.28],
+        })
+
+        assert _atm_call_iv(calls, 101.0) == 0.28
+
+    def test_no_usable_quotes(self):
+        calls = pd.DataFrame({"strike": [100.0, 105.0], "impliedVolatility": [np.nan, 0.0]})
+
+        assert _atm_call_iv(calls, 100.0) is None
+
+
+class TestGetIvTermStructure:
+    @patch("vol_toolkit.iv_tracker._cached_option_calls")
+    @patch("vol_toolkit.iv_tracker.get_spot", return_value=100.0)
+    @patch("vol_toolkit.iv_tracker._get_expirations")
+    def test_skips_failed_expirations(self, mock_expirations, mock_spot, mock_calls):
+        expirations = [(date.today() + timedelta(days=d)).isoformat() for d in (7, 14, 21)]
+        mock_expirations.return_value = tuple(expirations)
+        ivs = {expirations[0]: 0.30, expirations[2]: 0.25}
+
+        def fake_calls(ticker, expiration):
+            if expiration not in ivs:
+                raise ConnectionError("chain unavailable")
+            return pd.DataFrame({
+                "strike": [95.0, 100.0, 105.0],
+                "impliedVolatility": [0.5, ivs[expiration], 0.5],
+            })
+
+        mock_calls.side_effect = fake_calls
+
+        result = get_iv_term_structure("AAPL")
+
+        assert [r["expiration"] for r in result] == [expirations[0], expirations[2]]
+        assert [r["atm_iv"] for r in result] == [0.30, 0.25]
+        assert [r["days_to_expiry"] for r in result] == [7, 21]
+
+
+class TestGetExpirations:
+    @patch("vol_toolkit.iv_tracker.get_ticker")
+    def test_fetched_once(self, mock_ticker):
+        _get_expirations.cache_clear()
+        mock_ticker.return_value = MagicMock(options=("2026-01-16", "2026-02-20"))
+
+        assert _get_expirations("AAPL") == ("2026-01-16", "2026-02-20")
+        assert _get_expirations("AAPL") == ("2026-01-16", "2026-02-20")
+        mock_ticker.assert_called_once_with("AAPL")
+        _get_expirations.cache_clear()
@@ -0,0 +1,76 @@
+"""Tests for the Numba kernels against their pandas/NumPy equivalents."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vol_toolkit import _kernels
+from vol_toolkit._kernels import (
+    moving_std,
+    moving_std_multi,
+    rolling_std,
+)
+
+
+def _make_returns(n: int = 200, k: int = 3, seed: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, k)) * 0.01
+
+
+class TestRollingStd:
+    def test_matches_pandas(self):
+        x = _make_returns()
+        expected = pd.DataFrame(x).rolling(20).std().to_numpy()
+
+        np.testing.assert_allclose(rolling_std(x, 20), expected, rtol=1e-9, equal_nan=True)
+
+    def test_nan_restarts_window(self):
+        x = _make_returns(n=100, k=2)
+        x[0, 0] = np.nan
+        x[50, 1] = np.nan
+        expected = pd.DataFrame(x).rolling(10).std().to_numpy()
+
+        np.testing.assert_allclose(rolling_std(x, 10), expected, rtol=1e-9, equal_nan=True)
+
+
+@pytest.fixture(params=["bottleneck", "numba", "numpy"])
+def backend(request, monkeypatch):
+    """Force one ``moving_std`` backend, skipping if it is not installed."""
+    if request.param == "bottleneck":
+        monkeypatch.setattr(_kernels, "bn", pytest.importorskip("bottleneck"))
+        monkeypatch.setattr(_kernels, "HAVE_NUMBA", False)
+    elif request.param == "numba":
+        pytest.importorskip("numba")
+        monkeypatch.setattr(_kernels, "bn", None)
+        monkeypatch.setattr(_kernels, "HAVE_NUMBA", True)
+    else:
+        monkeypatch.setattr(_kernels, "bn", None)
+        monkeypatch.setattr(_kernels, "HAVE_NUMBA", False)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
+class TestMovingStd:
+    def test_matches_pandas(self):
+        x = _make_returns(n=100, k=2)
+        x[:5, 1] = np.nan  # shorter history padded at the top
+        expected = pd.DataFrame(x).rolling(20).std().to_numpy()
+
+        np.testing.assert_allclose(moving_std(x, 20), expected, rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(
+            moving_std(x[:, 0], 20), expected[:, 0], rtol=1e-9, equal_nan=True
+        )
+
+    def test_short_input_is_all_nan(self):
+        assert np.isnan(moving_std(np.ones(5), 20)).all()
+
+    def test_multi_matches_single_windows(self):
+        x = _make_returns(n=100, k=3)
+        x[:8, 2] = np.nan
+        results = moving_std_multi(x, (20, 10, 30))
+
+        for window, result in zip((20, 10, 30), results):
+            expected = pd.DataFrame(x).rolling(window).std().to_numpy()
+            np.testing.assert_allclose(result, expected, rtol=1e-9, equal_nan=True)
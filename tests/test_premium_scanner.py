@@ -2,28 +2,24 @@
 
 from __future__ import annotations
 
-import math
 from unittest.mock import patch
 
-import numpy as np
 import pandas as pd
 
+from tests.synthetic import gbm_path
 from vol_toolkit.premium_scanner import scan_vol_premium
 
 
 def _make_mock_prices(n: int = 300, sigma: float = 0.20, seed: int = 42) -> pd.DataFrame:
     """Create mock yfinance download output."""
-    rng = np.random.default_rng(seed)
-    dt = 1 / 252
-    log_ret = (0.0 - 0.5 * sigma**2) * dt + sigma * math.sqrt(dt) * rng.standard_normal(n)
-    close = 100 * np.exp(np.cumsum(log_ret))
+    close = gbm_path(n, 0.0, sigma, seed)
     dates = pd.bdate_range(start="2025-01-01", periods=len(close))
     return pd.DataFrame({"Close": close}, index=dates)
 
 
 class TestScanVolPremium:
     @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
-    @patch("vol_toolkit.premium_scanner.yf.download")
+    @patch("vol_toolkit.premium_scanner._cached_download")
     def test_basic_scan(self, mock_download, mock_atm):
         mock_download.return_value = _make_mock_prices(300, sigma=0.25)
 
@@ -38,7 +34,7 @@ class TestScanVolPremium:
         assert expected_cols.issubset(set(df.columns))
 
     @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
-    @patch("vol_toolkit.premium_scanner.yf.download")
+    @patch("vol_toolkit.premium_scanner._cached_download")
     def test_sorted_by_premium(self, mock_download, mock_atm):
         mock_download.return_value = _make_mock_prices(300, sigma=0.30)
 
@@ -49,7 +45,7 @@ class TestScanVolPremium:
             assert premiums == sorted(premiums, reverse=True)
 
     @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
-    @patch("vol_toolkit.premium_scanner.yf.download")
+    @patch("vol_toolkit.premium_scanner._cached_download")
     def test_empty_on_no_data(self, mock_download, mock_atm):
         mock_download.return_value = pd.DataFrame()
 
@@ -58,7 +54,7 @@ class TestScanVolPremium:
         assert df.empty
 
     @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=0.50)
-    @patch("vol_toolkit.premium_scanner.yf.download")
+    @patch("vol_toolkit.premium_scanner._cached_download")
     def test_with_options_iv(self, mock_download, mock_atm):
         # When ATM IV is available and higher than RV, premium should be positive
         mock_download.return_value = _make_mock_prices(300, sigma=0.15, seed=99)
@@ -67,3 +63,47 @@ class TestScanVolPremium:
 
         assert len(df) == 1
         assert df.iloc[0]["premium"] > 0  # IV=0.50 >> RV~0.15
+
+    @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
+    @patch("vol_toolkit.premium_scanner._cached_download")
+    def test_batched_download(self, mock_download, mock_atm):
+        # Grouped multi-ticker download: (ticker, field) columns, one request
+        frames = {
+            "LOW": _make_mock_prices(300, sigma=0.10, seed=1),
+            "HIGH": _make_mock_prices(300, sigma=0.60, seed=2),
+        }
+        mock_download.return_value = pd.concat(frames, axis=1)
+
+        df = scan_vol_premium(["LOW", "HIGH", "MISSING"])
+
+        mock_download.assert_called_once()
+        assert set(df["ticker"]) == {"LOW", "HIGH"}
+        rv = df.set_index("ticker")["realized_vol_20d"]
+        assert rv["HIGH"] > rv["LOW"]
+
+    @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
+    @patch("vol_toolkit.premium_scanner._cached_download")
+    def test_skips_ticker_without_close(self, mock_download, mock_atm):
+        good = _make_mock_prices(300, sigma=0.20)
+        frames = {"GOOD": good, "BAD": good.rename(columns={"Close": "Open"})}
+        mock_download.return_value = pd.concat(frames, axis=1)
+
+        df = scan_vol_premium(["GOOD", "BAD"])
+
+        assert df["ticker"].tolist() == ["GOOD"]
+        mock_atm.assert_called_once_with("GOOD")
+
+    @patch("vol_toolkit.premium_scanner._try_get_atm_iv", return_value=None)
+    @patch("vol_toolkit.premium_scanner._cached_download")
+    def test_lowercase_tickers(self, mock_download, mock_atm):
+        # yfinance returns upper-cased symbols whatever case was requested
+        frames = {
+            "SPY": _make_mock_prices(300, sigma=0.15, seed=1),
+            "QQQ": _make_mock_prices(300, sigma=0.25, seed=2),
+        }
+        mock_download.return_value = pd.concat(frames, axis=1)
+
+        df = scan_vol_premium(["spy", "qqq"])
+
+        assert mock_download.call_args.args[0] == ["SPY", "QQQ"]
+        assert set(df["ticker"]) == {"SPY", "QQQ"}